@@ -14,16 +14,16 @@ Architecture:
 import os
 import logging
 import asyncio
-import sys
+import time
 import uuid
 from typing import Optional, Any, Dict, List
 from contextlib import asynccontextmanager
 from datetime import datetime
 from pathlib import Path
+import orjson
 from dotenv import load_dotenv
 from fastapi import FastAPI, HTTPException, Request
-from fastapi.responses import JSONResponse, FileResponse, StreamingResponse
-from fastapi.staticfiles import StaticFiles
+from fastapi.responses import FileResponse, Response, StreamingResponse
 from pydantic import BaseModel
 from copilot import CopilotClient
 from copilot.generated.session_events import SessionEventType
@@ -45,15 +45,206 @@ WORK_DIR = os.getcwd()
 SKILLS_DIR = os.path.join(WORK_DIR, ".copilot_skills/blog/SKILL.md")
 BLOG_DIR = os.path.join(WORK_DIR, "blog")
 
+SESSION_POOL_SIZE = int(os.getenv("SESSION_POOL_SIZE", "2"))
+MAX_A2A_BODY_BYTES = int(os.getenv("MAX_A2A_BODY_BYTES", str(1024 * 1024)))
+SESSION_CONFIG = {
+    "model": "claude-sonnet-4.5",
+    "streaming": True,
+    "skill_directories": [SKILLS_DIR]
+}
+
 # Global variables
 copilot_client: Optional[CopilotClient] = None
 current_session = None
+session_pool: Optional["SessionPool"] = None
+
+# Opaque messageId for failure status updates (no per-error uuid needed)
+ERROR_MESSAGE_ID = str(uuid.UUID(int=0))
+
+# Agent card and root payloads never change, so let proxies cache them
+DISCOVERY_HEADERS = {"Cache-Control": "public, max-age=300"}
+
+# SSE configuration
+SSE_HEADERS = {
+    "Cache-Control": "no-cache",
+    "Connection": "keep-alive",
+    "X-Accel-Buffering": "no"
+}
+DELTA_FLUSH_SIZE = 2048  # characters buffered before an artifact frame is sent
+DELTA_FLUSH_INTERVAL = 0.03  # max seconds a delta waits before being sent
+
+
+def _sse_event(event: Dict[str, Any]) -> bytes:
+    """Frame an A2A event as a single SSE data message (orjson-encoded bytes)"""
+    return b"data: " + orjson.dumps(event) + b"\n\n"
+
+
+def _status_update(
+    jsonrpc: str,
+    request_id: Optional[str],
+    context_id: str,
+    task_id: str,
+    state: str,
+    *,
+    final: bool,
+    message_id: Optional[str] = None,
+    text: Optional[str] = None
+) -> Dict[str, Any]:
+    """Build an A2A TaskStatusUpdateEvent wrapped in its JSON-RPC envelope"""
+    status: Dict[str, Any] = {"state": state}
+    if message_id is not None:
+        status["message"] = {
+            "messageId": message_id,
+            "role": "agent",
+            "parts": [{"kind": "text", "text": text}]
+        }
+    return {
+        "jsonrpc": jsonrpc,
+        "id": request_id,
+        "result": {
+            "contextId": context_id,
+            "taskId": task_id,
+            "final": final,
+            "status": status,
+            "kind": "status-update"
+        }
+    }
+
+
+def _artifact_update(
+    jsonrpc: str,
+    request_id: Optional[str],
+    context_id: str,
+    task_id: str,
+    artifact_id: str,
+    text: str,
+    *,
+    append: Optional[bool] = None,
+    last_chunk: Optional[bool] = None
+) -> Dict[str, Any]:
+    """Build an A2A TaskArtifactUpdateEvent wrapped in its JSON-RPC envelope"""
+    result: Dict[str, Any] = {
+        "contextId": context_id,
+        "taskId": task_id,
+        "artifact": {
+            "artifactId": artifact_id,
+            "parts": [{"kind": "text", "text": text}]
+        }
+    }
+    if append is not None:
+        result["append"] = append
+    if last_chunk is not None:
+        result["lastChunk"] = last_chunk
+    result["kind"] = "artifact-update"
+    return {
+        "jsonrpc": jsonrpc,
+        "id": request_id,
+        "result": result
+    }
+
+
+def _sse_single(event: Dict[str, Any]) -> Response:
+    """Return a one-shot A2A event as a single-frame SSE body (no generator or chunked encoding)"""
+    return Response(content=_sse_event(event), media_type="text/event-stream")
+
+
+def _event_stream(events) -> StreamingResponse:
+    """Wrap an async generator of SSE frames in an event-stream response"""
+    return StreamingResponse(
+        events,
+        media_type="text/event-stream",
+        headers=SSE_HEADERS
+    )
+
+
+class SessionPool:
+    """Keeps pre-created Copilot sessions warm so requests skip create_session latency
+    
+    Sessions carry conversation history, so each one serves a single request
+    and is destroyed on release; the pool refills itself in the background.
+    """
+    
+    def __init__(self, client: CopilotClient, config: Dict[str, Any], size: int):
+        self._client = client
+        self._config = config
+        self._size = size
+        self._warm: asyncio.Queue = asyncio.Queue(maxsize=size)
+        self._creating = asyncio.Semaphore(size)
+        self._refills: set = set()
+    
+    def start(self) -> None:
+        """Begin warming sessions up to the pool size"""
+        for _ in range(self._size):
+            self._refill()
+    
+    def _refill(self) -> None:
+        task = asyncio.create_task(self._create_warm_session())
+        self._refills.add(task)
+        task.add_done_callback(self._refills.discard)
+    
+    async def _create_warm_session(self) -> None:
+        async with self._creating:
+            if self._warm.full():
+                return
+            try:
+                session = await self._client.create_session(self._config)
+            except Exception as e:
+                logger.warning(f"Could not warm Copilot session: {e}")
+                return
+        try:
+            self._warm.put_nowait(session)
+        except asyncio.QueueFull:
+            await self.release(session)
+    
+    async def acquire(self):
+        """Take a warm session (creating one if none is ready) and schedule a refill"""
+        try:
+            session = self._warm.get_nowait()
+        except asyncio.QueueEmpty:
+            session = await self._client.create_session(self._config)
+        self._refill()
+        return session
+    
+    async def release(self, session) -> None:
+        """Destroy a used session"""
+        try:
+            await session.destroy()
+        except Exception as e:
+            logger.warning(f"Could not destroy session {session.session_id}: {e}")
+    
+    async def close(self) -> None:
+        """Cancel pending warm-ups and destroy idle sessions"""
+        for task in list(self._refills):
+            task.cancel()
+        while not self._warm.empty():
+            await self.release(self._warm.get_nowait())
+
+
+def _etag_matches(if_none_match: Optional[str], etag: str) -> bool:
+    """Check an If-None-Match header against an ETag using weak comparison (RFC 9110)"""
+    if not if_none_match:
+        return False
+    for candidate in if_none_match.split(","):
+        candidate = candidate.strip()
+        if candidate == "*" or candidate.removeprefix("W/") == etag:
+            return True
+    return False
+
+
+def _scan_blogs() -> List[tuple]:
+    """Return (filename, stat_result) for every blog-*.md file in a single directory pass"""
+    with os.scandir(BLOG_DIR) as entries:
+        return [
+            (entry.name, entry.stat())
+            for entry in entries
+            if entry.name.startswith("blog-") and entry.name.endswith(".md")
+        ]
 
 
 @asynccontextmanager
 async def lifespan(app: FastAPI):
     """Application lifespan - initialize Copilot client on startup"""
-    global copilot_client, BLOG_DIR
+    global copilot_client, session_pool, BLOG_DIR
     
     logger.info("🚀 Starting Blog Agent...")
     logger.info(f"Work Directory: {WORK_DIR}")
@@ -72,6 +263,10 @@ async def lifespan(app: FastAPI):
         copilot_client = CopilotClient()
         await copilot_client.start()
         
+        # Warm Copilot sessions ahead of the first request
+        session_pool = SessionPool(copilot_client, SESSION_CONFIG, SESSION_POOL_SIZE)
+        session_pool.start()
+        
         logger.info("✅ Blog Agent initialized successfully")
         
     except Exception as e:
@@ -82,6 +277,8 @@ async def lifespan(app: FastAPI):
     
     # Cleanup
     logger.info("🛑 Shutting down Blog Agent...")
+    if session_pool:
+        await session_pool.close()
     if copilot_client:
         await copilot_client.stop()
 
@@ -130,181 +327,173 @@ class A2ARequest(BaseModel):
     params: Optional[Dict[str, Any]] = None
 
 
-async def process_a2a_message_streaming(message_text: str, jsonrpc: str, request_id: str, task_id: str, context_id: str):
+async def process_a2a_message_streaming(request: Request, message_text: str, jsonrpc: str, request_id: str, task_id: str, context_id: str):
     """Process an A2A message and yield SSE events as the response is generated"""
-    import json
     global copilot_client
     
-    message_id_working = str(uuid.uuid4())
-    message_id_complete = str(uuid.uuid4())
-    artifact_id = str(uuid.uuid4())
+    # One random id per request; per-message ids are derived from it
+    base_id = uuid.uuid4().hex
+    message_id_working = f"{base_id}-working"
+    message_id_complete = f"{base_id}-complete"
+    artifact_id = f"{base_id}-artifact"
     
     # Send initial working status immediately
-    status_event = {
-        "jsonrpc": jsonrpc,
-        "id": request_id,
-        "result": {
-            "contextId": context_id,
-            "taskId": task_id,
-            "final": False,
-            "status": {
-                "state": "working",
-                "message": {
-                    "messageId": message_id_working,
-                    "role": "agent",
-                    "parts": [{"kind": "text", "text": "Processing your request..."}]
-                }
-            },
-            "kind": "status-update"
-        }
-    }
-    yield f"data: {json.dumps(status_event)}\n\n"
+    status_event = _status_update(
+        jsonrpc, request_id, context_id, task_id, "working",
+        final=False, message_id=message_id_working, text="Processing your request..."
+    )
+    yield _sse_event(status_event)
     
     if copilot_client is None:
-        error_event = {
-            "jsonrpc": jsonrpc,
-            "id": request_id,
-            "result": {
-                "contextId": context_id,
-                "taskId": task_id,
-                "final": True,
-                "status": {
-                    "state": "failed",
-                    "message": {
-                        "messageId": str(uuid.uuid4()),
-                        "role": "agent",
-                        "parts": [{"kind": "text", "text": "Agent not initialized"}]
-                    }
-                },
-                "kind": "status-update"
-            }
-        }
-        yield f"data: {json.dumps(error_event)}\n\n"
+        error_event = _status_update(
+            jsonrpc, request_id, context_id, task_id, "failed",
+            final=True, message_id=ERROR_MESSAGE_ID, text="Agent not initialized"
+        )
+        yield _sse_event(error_event)
         return
     
+    session = None
+    task = None
     try:
-        # Create a new session for this task
-        session = await copilot_client.create_session({
-            "model": "claude-sonnet-4.5",
-            "streaming": True,
-            "skill_directories": [SKILLS_DIR]
-        })
+        # Take a pre-warmed session for this task
+        session = await session_pool.acquire()
         
-        logger.info(f"✓ A2A Session created with ID: {session.session_id}")
+        logger.info(f"✓ A2A Session acquired with ID: {session.session_id}")
         
-        # Collect the response
-        response_chunks = []
+        # Forward each delta to the client as soon as Copilot emits it
+        deltas: asyncio.Queue = asyncio.Queue()
+        response_buf = bytearray()
         chunk_count = 0
         
+        # Bind the hot-path lookups once; handle_event runs for every delta
+        delta_type = SessionEventType.ASSISTANT_MESSAGE_DELTA
+        push_delta = deltas.put_nowait
+        
         def handle_event(event):
-            nonlocal chunk_count
-            if event.type == SessionEventType.ASSISTANT_MESSAGE_DELTA:
-                response_chunks.append(event.data.delta_content)
-                chunk_count += 1
+            if event.type is delta_type:
+                push_delta(event.data.delta_content)
         
         session.on(handle_event)
         
         # Start the task (non-blocking)
         task = asyncio.create_task(session.send_and_wait({"prompt": message_text}, timeout=600))
         
-        # Send periodic heartbeat events while waiting
+        # Build the heartbeat envelope once per request; only the message id
+        # and text change between beats (frames are encoded before mutation)
+        heartbeat_event = _status_update(
+            jsonrpc, request_id, context_id, task_id, "working",
+            final=False, message_id="", text=""
+        )
+        heartbeat_message = heartbeat_event["result"]["status"]["message"]
+        heartbeat_part = heartbeat_message["parts"][0]
+        
+        # Incremental artifact envelope, one frame per batch of deltas
+        artifact_event = _artifact_update(
+            jsonrpc, request_id, context_id, task_id, artifact_id, "",
+            append=False, last_chunk=False
+        )
+        artifact_result = artifact_event["result"]
+        artifact_part = artifact_result["artifact"]["parts"][0]
+        
+        def artifact_frame(text: str) -> bytes:
+            artifact_part["text"] = text
+            frame = _sse_event(artifact_event)
+            artifact_result["append"] = True
+            return frame
+        
+        # Stream deltas coalesced into frames of DELTA_FLUSH_SIZE characters or
+        # DELTA_FLUSH_INTERVAL seconds, with a heartbeat after 5 quiet seconds
+        loop = asyncio.get_running_loop()
+        started = loop.time()
         heartbeat_count = 0
-        while not task.done():
-            await asyncio.sleep(5)  # Check every 5 seconds
-            heartbeat_count += 1
-            
-            # Send a working status update to keep connection alive
-            heartbeat_event = {
-                "jsonrpc": jsonrpc,
-                "id": request_id,
-                "result": {
-                    "contextId": context_id,
-                    "taskId": task_id,
-                    "final": False,
-                    "status": {
-                        "state": "working",
-                        "message": {
-                            "messageId": str(uuid.uuid4()),
-                            "role": "agent",
-                            "parts": [{"kind": "text", "text": f"Still processing... ({heartbeat_count * 5}s elapsed, {len(response_chunks)} chunks received)"}]
-                        }
-                    },
-                    "kind": "status-update"
-                }
-            }
-            yield f"data: {json.dumps(heartbeat_event)}\n\n"
+        pending: List[str] = []
+        pending_size = 0
+        flush_at: Optional[float] = None
+        next_delta = asyncio.ensure_future(deltas.get())
+        try:
+            while True:
+                timeout = 5 if flush_at is None else max(0.0, flush_at - loop.time())
+                done, _ = await asyncio.wait(
+                    {task, next_delta}, timeout=timeout, return_when=asyncio.FIRST_COMPLETED
+                )
+                if next_delta in done:
+                    delta = next_delta.result()
+                    next_delta = asyncio.ensure_future(deltas.get())
+                    response_buf.extend(delta.encode("utf-8"))
+                    chunk_count += 1
+                    pending.append(delta)
+                    pending_size += len(delta)
+                    if flush_at is None:
+                        flush_at = loop.time() + DELTA_FLUSH_INTERVAL
+                    if pending_size < DELTA_FLUSH_SIZE and loop.time() < flush_at:
+                        continue
+                
+                if pending:
+                    yield artifact_frame(''.join(pending))
+                    pending.clear()
+                    pending_size = 0
+                    flush_at = None
+                    continue
+                
+                if task in done:
+                    break
+                
+                if await request.is_disconnected():
+                    logger.info(f"🔌 Client disconnected from task {task_id}, cancelling Copilot task")
+                    return
+                
+                # Send a working status update to keep connection alive
+                heartbeat_count += 1
+                heartbeat_message["messageId"] = f"{base_id}-heartbeat-{heartbeat_count}"
+                heartbeat_part["text"] = f"Still processing... ({int(loop.time() - started)}s elapsed, {chunk_count} chunks received)"
+                yield _sse_event(heartbeat_event)
+        finally:
+            next_delta.cancel()
         
         # Wait for the task to complete and get any exception
         await task
         
+        # Pick up deltas delivered in the same tick as task completion
+        while not deltas.empty():
+            delta = deltas.get_nowait()
+            response_buf.extend(delta.encode("utf-8"))
+            chunk_count += 1
+            pending.append(delta)
+        if pending:
+            yield artifact_frame(''.join(pending))
+        
         # Combine response
-        response_text = ''.join(response_chunks)
+        response_text = response_buf.decode("utf-8")
         if not response_text:
             response_text = "Task completed successfully."
         
-        # Send the artifact with result
-        artifact_event = {
-            "jsonrpc": jsonrpc,
-            "id": request_id,
-            "result": {
-                "contextId": context_id,
-                "taskId": task_id,
-                "artifact": {
-                    "artifactId": artifact_id,
-                    "parts": [
-                        {
-                            "kind": "text",
-                            "text": response_text
-                        }
-                    ]
-                },
-                "kind": "artifact-update"
-            }
-        }
-        yield f"data: {json.dumps(artifact_event)}\n\n"
+        # Close the artifact with the full text, replacing the streamed chunks, so
+        # clients that only read the final artifact frame see the whole response
+        artifact_result["lastChunk"] = True
+        artifact_result["append"] = False
+        yield artifact_frame(response_text)
         
         # Send completion status
-        complete_event = {
-            "jsonrpc": jsonrpc,
-            "id": request_id,
-            "result": {
-                "contextId": context_id,
-                "taskId": task_id,
-                "final": True,
-                "status": {
-                    "state": "completed",
-                    "message": {
-                        "messageId": message_id_complete,
-                        "role": "agent",
-                        "parts": [{"kind": "text", "text": response_text}]
-                    }
-                },
-                "kind": "status-update"
-            }
-        }
-        yield f"data: {json.dumps(complete_event)}\n\n"
+        complete_event = _status_update(
+            jsonrpc, request_id, context_id, task_id, "completed",
+            final=True, message_id=message_id_complete, text=response_text
+        )
+        yield _sse_event(complete_event)
         
     except Exception as e:
         logger.error(f"❌ Error processing A2A message: {e}", exc_info=True)
-        error_event = {
-            "jsonrpc": jsonrpc,
-            "id": request_id,
-            "result": {
-                "contextId": context_id,
-                "taskId": task_id,
-                "final": True,
-                "status": {
-                    "state": "failed",
-                    "message": {
-                        "messageId": str(uuid.uuid4()),
-                        "role": "agent",
-                        "parts": [{"kind": "text", "text": f"Error: {str(e)}"}]
-                    }
-                },
-                "kind": "status-update"
-            }
-        }
-        yield f"data: {json.dumps(error_event)}\n\n"
+        error_event = _status_update(
+            jsonrpc, request_id, context_id, task_id, "failed",
+            final=True, message_id=ERROR_MESSAGE_ID, text=f"Error: {str(e)}"
+        )
+        yield _sse_event(error_event)
+    finally:
+        # Stop the Copilot turn if the stream ended early (client disconnect or
+        # generator close) so it doesn't run on to the 600s timeout
+        if task is not None and not task.done():
+            task.cancel()
+        if session is not None:
+            await session_pool.release(session)
 
 
 async def process_a2a_message(message_text: str) -> str:
@@ -314,22 +503,23 @@ async def process_a2a_message(message_text: str) -> str:
     if copilot_client is None:
         return "Agent not initialized"
     
+    session = None
     try:
-        # Create a new session for this task
-        session = await copilot_client.create_session({
-            "model": "claude-sonnet-4.5",
-            "streaming": True,
-            "skill_directories": [SKILLS_DIR]
-        })
+        # Take a pre-warmed session for this task
+        session = await session_pool.acquire()
         
-        logger.info(f"✓ A2A Session created with ID: {session.session_id}")
+        logger.info(f"✓ A2A Session acquired with ID: {session.session_id}")
         
         # Collect the response
-        response_chunks = []
+        response_buf = bytearray()
+        
+        # Bind the hot-path lookups once; handle_event runs for every delta
+        delta_type = SessionEventType.ASSISTANT_MESSAGE_DELTA
+        append_delta = response_buf.extend
         
         def handle_event(event):
-            if event.type == SessionEventType.ASSISTANT_MESSAGE_DELTA:
-                response_chunks.append(event.data.delta_content)
+            if event.type is delta_type:
+                append_delta(event.data.delta_content.encode("utf-8"))
         
         session.on(handle_event)
         
@@ -337,13 +527,16 @@ async def process_a2a_message(message_text: str) -> str:
         await session.send_and_wait({"prompt": message_text}, timeout=600)
         
         # Combine response
-        response_text = ''.join(response_chunks)
+        response_text = response_buf.decode("utf-8")
         
         return response_text if response_text else "Task completed successfully."
         
     except Exception as e:
         logger.error(f"❌ Error processing A2A message: {e}", exc_info=True)
         return f"Error: {str(e)}"
+    finally:
+        if session is not None:
+            await session_pool.release(session)
 
 async def generate_sse_response(jsonrpc: str, request_id: str, task_id: str, context_id: str, result_text: str):
     """Generate Server-Sent Events response for A2A protocol
@@ -354,74 +547,30 @@ async def generate_sse_response(jsonrpc: str, request_id: str, task_id: str, con
     
     Each message inside status needs: messageId, role, parts
     """
-    import json
     
     message_id_working = str(uuid.uuid4())
     message_id_complete = str(uuid.uuid4())
     artifact_id = str(uuid.uuid4())
     
     # Send task status update - working
-    status_event = {
-        "jsonrpc": jsonrpc,
-        "id": request_id,
-        "result": {
-            "contextId": context_id,
-            "taskId": task_id,
-            "final": False,
-            "status": {
-                "state": "working",
-                "message": {
-                    "messageId": message_id_working,
-                    "role": "agent",
-                    "parts": [{"kind": "text", "text": "Processing your request..."}]
-                }
-            },
-            "kind": "status-update"
-        }
-    }
-    yield f"data: {json.dumps(status_event)}\n\n"
+    status_event = _status_update(
+        jsonrpc, request_id, context_id, task_id, "working",
+        final=False, message_id=message_id_working, text="Processing your request..."
+    )
+    yield _sse_event(status_event)
     
     # Send the artifact with result
-    artifact_event = {
-        "jsonrpc": jsonrpc,
-        "id": request_id,
-        "result": {
-            "contextId": context_id,
-            "taskId": task_id,
-            "artifact": {
-                "artifactId": artifact_id,
-                "parts": [
-                    {
-                        "kind": "text",
-                        "text": result_text
-                    }
-                ]
-            },
-            "kind": "artifact-update"
-        }
-    }
-    yield f"data: {json.dumps(artifact_event)}\n\n"
+    artifact_event = _artifact_update(
+        jsonrpc, request_id, context_id, task_id, artifact_id, result_text
+    )
+    yield _sse_event(artifact_event)
     
     # Send completion status
-    complete_event = {
-        "jsonrpc": jsonrpc,
-        "id": request_id,
-        "result": {
-            "contextId": context_id,
-            "taskId": task_id,
-            "final": True,
-            "status": {
-                "state": "completed",
-                "message": {
-                    "messageId": message_id_complete,
-                    "role": "agent",
-                    "parts": [{"kind": "text", "text": result_text}]
-                }
-            },
-            "kind": "status-update"
-        }
-    }
-    yield f"data: {json.dumps(complete_event)}\n\n"
+    complete_event = _status_update(
+        jsonrpc, request_id, context_id, task_id, "completed",
+        final=True, message_id=message_id_complete, text=result_text
+    )
+    yield _sse_event(complete_event)
 
 
 @app.post("/")
@@ -437,8 +586,17 @@ async def a2a_jsonrpc_endpoint(request: Request):
     
     Returns Server-Sent Events (SSE) stream as required by A2A protocol
     """
+    # Reject oversize bodies before reading or parsing them
+    content_length = request.headers.get("content-length")
+    if content_length and content_length.isdigit() and int(content_length) > MAX_A2A_BODY_BYTES:
+        raise HTTPException(status_code=413, detail="A2A request body too large")
+    
+    raw_body = await request.body()
+    if len(raw_body) > MAX_A2A_BODY_BYTES:
+        raise HTTPException(status_code=413, detail="A2A request body too large")
+    
     try:
-        body = await request.json()
+        body = orjson.loads(raw_body)
         logger.info(f"📥 A2A Request: {body.get('method', 'unknown')}")
         
         jsonrpc = body.get("jsonrpc", "2.0")
@@ -468,14 +626,8 @@ async def a2a_jsonrpc_endpoint(request: Request):
             context_id = params.get("contextId") or str(uuid.uuid4())
             
             # Return SSE streaming response with heartbeat support
-            return StreamingResponse(
-                process_a2a_message_streaming(message_text, jsonrpc, request_id, task_id, context_id),
-                media_type="text/event-stream",
-                headers={
-                    "Cache-Control": "no-cache",
-                    "Connection": "keep-alive",
-                    "X-Accel-Buffering": "no"
-                }
+            return _event_stream(
+                process_a2a_message_streaming(request, message_text, jsonrpc, request_id, task_id, context_id)
             )
         
         elif method == "tasks/get":
@@ -483,71 +635,38 @@ async def a2a_jsonrpc_endpoint(request: Request):
             task_id = params.get("id", "unknown")
             context_id = params.get("contextId") or str(uuid.uuid4())
             
-            async def status_sse():
-                import json
-                event = {
-                    "jsonrpc": jsonrpc,
-                    "id": request_id,
-                    "result": {
-                        "contextId": context_id,
-                        "taskId": task_id,
-                        "final": True,
-                        "status": {
-                            "state": "completed"
-                        },
-                        "kind": "status-update"
-                    }
-                }
-                yield f"data: {json.dumps(event)}\n\n"
-            
-            return StreamingResponse(
-                status_sse(),
-                media_type="text/event-stream"
+            return _sse_single(
+                _status_update(jsonrpc, request_id, context_id, task_id, "completed", final=True)
             )
         
         else:
             # Unknown method - return error as SSE
-            async def error_sse():
-                import json
-                event = {
-                    "jsonrpc": jsonrpc,
-                    "id": request_id,
-                    "error": {
-                        "code": -32601,
-                        "message": f"Method not found: {method}"
-                    }
+            event = {
+                "jsonrpc": jsonrpc,
+                "id": request_id,
+                "error": {
+                    "code": -32601,
+                    "message": f"Method not found: {method}"
                 }
-                yield f"data: {json.dumps(event)}\n\n"
-            
-            return StreamingResponse(
-                error_sse(),
-                media_type="text/event-stream"
-            )
+            }
+            return _sse_single(event)
             
     except Exception as e:
         logger.error(f"❌ A2A Error: {e}", exc_info=True)
         
-        async def exception_sse():
-            import json
-            event = {
-                "jsonrpc": "2.0",
-                "id": None,
-                "error": {
-                    "code": -32603,
-                    "message": str(e)
-                }
+        event = {
+            "jsonrpc": "2.0",
+            "id": None,
+            "error": {
+                "code": -32603,
+                "message": str(e)
             }
-            yield f"data: {json.dumps(event)}\n\n"
-        
-        return StreamingResponse(
-            exception_sse(),
-            media_type="text/event-stream"
-        )
+        }
+        return _sse_single(event)
 
 
-@app.get("/")
-async def root():
-    """Root endpoint"""
+def _build_root() -> Dict[str, Any]:
+    """Build the root endpoint payload"""
     return {
         "agent": "blog_agent",
         "status": "running",
@@ -556,6 +675,16 @@ async def root():
     }
 
 
+# Static payload, serialized once at import time
+ROOT_BYTES = orjson.dumps(_build_root())
+
+
+@app.get("/")
+async def root():
+    """Root endpoint"""
+    return Response(content=ROOT_BYTES, media_type="application/json", headers=DISCOVERY_HEADERS)
+
+
 @app.get("/health")
 async def health():
     """Health check endpoint"""
@@ -565,24 +694,34 @@ async def health():
 
 
 @app.get("/blog/{filename}")
-async def download_blog(filename: str):
+async def download_blog(filename: str, request: Request):
     """
     Download a blog file by filename
     
+    Supports conditional GET: a matching If-None-Match returns 304 without a body.
+    
     Example: GET /blog/blog-2026-01-30.md
     """
     file_path = Path(BLOG_DIR) / filename
-    
-    if not file_path.exists():
+    try:
+        st = file_path.stat()
+    except (FileNotFoundError, NotADirectoryError):
         raise HTTPException(status_code=404, detail=f"Blog file '{filename}' not found")
     
     if not file_path.suffix == ".md":
         raise HTTPException(status_code=400, detail="Only .md files are allowed")
     
+    etag = f'"{st.st_mtime_ns:x}-{st.st_size:x}"'
+    if _etag_matches(request.headers.get("if-none-match"), etag):
+        return Response(status_code=304, headers={"ETag": etag})
+    
+    # Reusing the stat result skips Starlette's own stat before sendfile
     return FileResponse(
         path=str(file_path),
         filename=filename,
-        media_type="text/markdown"
+        media_type="text/markdown",
+        stat_result=st,
+        headers={"ETag": etag}
     )
 
 
@@ -594,14 +733,13 @@ async def list_blogs():
     Returns a list of blog files with download URLs
     """
     try:
-        blog_files = list(Path(BLOG_DIR).glob("blog-*.md"))
         blogs = []
-        for blog_file in sorted(blog_files, reverse=True):
+        for name, st in sorted(_scan_blogs(), reverse=True):
             blogs.append({
-                "filename": blog_file.name,
-                "download_url": f"/blog/{blog_file.name}",
-                "size": blog_file.stat().st_size,
-                "modified": datetime.fromtimestamp(blog_file.stat().st_mtime).isoformat()
+                "filename": name,
+                "download_url": f"/blog/{name}",
+                "size": st.st_size,
+                "modified": time.strftime("%Y-%m-%dT%H:%M:%S", time.localtime(st.st_mtime))
             })
         return {"blogs": blogs, "total": len(blogs)}
     except Exception as e:
@@ -623,22 +761,23 @@ async def execute_task(request: TaskRequest):
     
     logger.info(f"📝 Task from {request.user_id}: {request.task}")
     
+    session = None
     try:
-        # Create a new session for this task
-        session = await copilot_client.create_session({
-            "model": "claude-sonnet-4.5",
-            "streaming": True,
-            "skill_directories": [SKILLS_DIR]
-        })
+        # Take a pre-warmed session for this task
+        session = await session_pool.acquire()
         
-        logger.info(f"✓ Session created with ID: {session.session_id}")
+        logger.info(f"✓ Session acquired with ID: {session.session_id}")
         
         # Collect the response
-        response_chunks = []
+        response_buf = bytearray()
+        
+        # Bind the hot-path lookups once; handle_event runs for every delta
+        delta_type = SessionEventType.ASSISTANT_MESSAGE_DELTA
+        append_delta = response_buf.extend
         
         def handle_event(event):
-            if event.type == SessionEventType.ASSISTANT_MESSAGE_DELTA:
-                response_chunks.append(event.data.delta_content)
+            if event.type is delta_type:
+                append_delta(event.data.delta_content.encode("utf-8"))
         
         session.on(handle_event)
         
@@ -658,20 +797,20 @@ Please follow the Blog Skill guidelines:
         await session.send_and_wait({"prompt": enhanced_prompt}, timeout=600)
         
         # Combine response
-        response_text = ''.join(response_chunks)
+        response_text = response_buf.decode("utf-8")
         
         # Find the generated blog file
         blog_path = None
         download_url = None
         try:
             # Look for the most recently created blog file
-            blog_files = list(Path(BLOG_DIR).glob("blog-*.md"))
+            blog_files = _scan_blogs()
             if blog_files:
                 # Get the most recent file
-                latest_blog = max(blog_files, key=lambda p: p.stat().st_mtime)
-                blog_path = str(latest_blog.absolute())
+                latest_name, _ = max(blog_files, key=lambda item: item[1].st_mtime)
+                blog_path = os.path.join(BLOG_DIR, latest_name)
                 # Create a relative download path
-                download_url = f"/blog/{latest_blog.name}"
+                download_url = f"/blog/{latest_name}"
                 logger.info(f"📄 Generated blog: {blog_path}")
         except Exception as e:
             logger.warning(f"Could not determine blog path: {e}")
@@ -688,23 +827,18 @@ Please follow the Blog Skill guidelines:
     except Exception as e:
         logger.error(f"❌ Error executing task: {e}", exc_info=True)
         raise HTTPException(status_code=500, detail=f"Error executing task: {str(e)}")
+    finally:
+        if session is not None:
+            await session_pool.release(session)
 
 
-@app.get("/.well-known/agent-card.json")
-async def agent_card():
-    """
-    A2A Protocol: Agent Card endpoint
-    
-    This endpoint exposes the agent's capabilities for discovery by other agents
-    and the orchestrator.
-    
-    Follows A2A Protocol specification: https://a2a-protocol.org/latest/
-    """
+def _build_agent_card() -> Dict[str, Any]:
+    """Build the A2A Agent Card served at /.well-known/agent-card.json"""
     # Use configured base URL (from env var or default to localhost)
     # base_url = AGENT_BASE_URL
     base_url = ''
     
-    return JSONResponse({
+    return {
         "name": "blog_agent",
         "description": "Specialized blog generation agent with DeepSearch research and technical evangelist writing style",
         "version": "1.0.0",
@@ -768,16 +902,38 @@ async def agent_card():
             "organization": "Kinfey Lo",
             "url": "https://github.com/kinfey"
         }
-    })
+    }
+
+
+# The card never changes for the process lifetime, so bake it at import time
+AGENT_CARD_BYTES = orjson.dumps(_build_agent_card())
+
+
+@app.get("/.well-known/agent-card.json")
+async def agent_card():
+    """
+    A2A Protocol: Agent Card endpoint
+    
+    This endpoint exposes the agent's capabilities for discovery by other agents
+    and the orchestrator.
+    
+    Follows A2A Protocol specification: https://a2a-protocol.org/latest/
+    """
+    return Response(content=AGENT_CARD_BYTES, media_type="application/json", headers=DISCOVERY_HEADERS)
 
 
 if __name__ == "__main__":
     import uvicorn
     
-    logger.info(f"📝 Starting Blog Agent on port {AGENT_PORT}")
+    # Each worker process gets its own Copilot client and session pool
+    workers = int(os.getenv("WEB_CONCURRENCY", "1"))
+    
+    logger.info(f"📝 Starting Blog Agent on port {AGENT_PORT} ({workers} worker(s))")
+    # The default "auto" loop/http settings use uvloop and httptools when installed
     uvicorn.run(
-        app,
+        "main:app" if workers > 1 else app,  # uvicorn needs an import string to spawn workers
         host="0.0.0.0",
         port=AGENT_PORT,
+        workers=workers,
         log_level="info"
     )
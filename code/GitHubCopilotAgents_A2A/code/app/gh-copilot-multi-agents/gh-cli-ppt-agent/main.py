@@ -16,13 +16,15 @@ import logging
 import asyncio
 import sys
 import uuid
-from typing import Optional, Any, Dict, List
+from typing import Optional, Any, Callable, Dict, List
+from collections import deque
 from contextlib import asynccontextmanager
 from datetime import datetime
 from pathlib import Path
+import orjson
 from dotenv import load_dotenv
 from fastapi import FastAPI, HTTPException, Request
-from fastapi.responses import JSONResponse, FileResponse, StreamingResponse
+from fastapi.responses import FileResponse, ORJSONResponse, Response, StreamingResponse
 from fastapi.staticfiles import StaticFiles
 from pydantic import BaseModel
 from copilot import CopilotClient
@@ -41,29 +43,152 @@ logger = logging.getLogger(__name__)
 # Configuration
 AGENT_PORT = int(os.getenv("AGENT_PORT", "8002"))
 AGENT_BASE_URL = os.getenv("AGENT_BASE_URL", "http://localhost:8002")
-WORK_DIR = os.getcwd()
-SKILLS_DIR = os.path.join(WORK_DIR, ".copilot_skills/ppt/SKILL.md")
-PPT_DIR = os.path.join(WORK_DIR, "ppt")
+WORK_DIR = Path(os.getcwd())
+SKILLS_DIR = str(WORK_DIR / ".copilot_skills/ppt/SKILL.md")
+PPT_DIR = WORK_DIR / "ppt"
+PPT_EXTENSIONS = frozenset({".pptx", ".ppt", ".pdf", ".md"})
+PPT_MEDIA_TYPES = {
+    ".pptx": "application/vnd.openxmlformats-officedocument.presentationml.presentation",
+    ".ppt": "application/vnd.ms-powerpoint",
+    ".pdf": "application/pdf",
+    ".md": "text/markdown"
+}
+
+SESSION_POOL_SIZE = int(os.getenv("SESSION_POOL_SIZE", "2"))
+SESSION_CONFIG = {
+    "model": "claude-sonnet-4.5",
+    "streaming": True,
+    "skill_directories": [SKILLS_DIR]
+}
 
 # Global variables
 copilot_client: Optional[CopilotClient] = None
 current_session = None
+session_pool: Optional["SessionPool"] = None
+
+# SSE configuration
+SSE_HEADERS = {
+    "Cache-Control": "no-cache",
+    "Connection": "keep-alive",
+    "X-Accel-Buffering": "no"
+}
+HEARTBEAT_MIN_INTERVAL = 1.0  # seconds between progress heartbeats while chunks stream in
+HEARTBEAT_MAX_INTERVAL = 15.0  # longest quiet period before a keep-alive heartbeat
+
+
+# Random uuid4 strings are generated in batches so streaming requests read
+# /dev/urandom once per UUID_BATCH_SIZE ids rather than once per id
+UUID_BATCH_SIZE = 64
+_uuid_cache: deque = deque()
+
+
+def _uuid() -> str:
+    """Return a random (version 4) UUID string from the pre-generated pool"""
+    if not _uuid_cache:
+        raw = os.urandom(16 * UUID_BATCH_SIZE)
+        _uuid_cache.extend(
+            str(uuid.UUID(bytes=raw[i:i + 16], version=4))
+            for i in range(0, len(raw), 16)
+        )
+    return _uuid_cache.popleft()
+
+
+def _sse_event(event: Dict[str, Any]) -> bytes:
+    """Frame an A2A event as a single SSE data message (orjson-encoded bytes)"""
+    return b"data: " + orjson.dumps(event) + b"\n\n"
+
+
+def _event_stream(events) -> StreamingResponse:
+    """Wrap an async generator of SSE frames in an event-stream response"""
+    return StreamingResponse(
+        events,
+        media_type="text/event-stream",
+        headers=SSE_HEADERS
+    )
+
+
+class SessionPool:
+    """Keeps pre-created Copilot sessions warm so requests skip create_session latency
+    
+    Sessions carry conversation history, so each one serves a single request
+    and is destroyed on release; the pool refills itself in the background.
+    """
+    
+    def __init__(self, client: CopilotClient, config: Dict[str, Any], size: int):
+        self._client = client
+        self._config = config
+        self._size = size
+        self._warm: asyncio.Queue = asyncio.Queue(maxsize=size)
+        self._creating = asyncio.Semaphore(size)
+        self._refills: set = set()
+    
+    def start(self) -> None:
+        """Begin warming sessions up to the pool size"""
+        for _ in range(self._size):
+            self._refill()
+    
+    def _refill(self) -> None:
+        task = asyncio.create_task(self._create_warm_session())
+        self._refills.add(task)
+        task.add_done_callback(self._refills.discard)
+    
+    async def _create_warm_session(self) -> None:
+        async with self._creating:
+            if self._warm.full():
+                return
+            try:
+                session = await self._client.create_session(self._config)
+            except Exception as e:
+                logger.warning(f"Could not warm Copilot session: {e}")
+                return
+        try:
+            self._warm.put_nowait(session)
+        except asyncio.QueueFull:
+            await self.release(session)
+    
+    async def acquire(self):
+        """Take a warm session (creating one if none is ready) and schedule a refill"""
+        try:
+            session = self._warm.get_nowait()
+        except asyncio.QueueEmpty:
+            session = await self._client.create_session(self._config)
+        self._refill()
+        return session
+    
+    async def release(self, session) -> None:
+        """Destroy a used session"""
+        try:
+            await session.destroy()
+        except Exception as e:
+            logger.warning(f"Could not destroy session {session.session_id}: {e}")
+    
+    async def close(self) -> None:
+        """Cancel pending warm-ups and destroy idle sessions"""
+        for task in list(self._refills):
+            task.cancel()
+        while not self._warm.empty():
+            await self.release(self._warm.get_nowait())
 
 
 @asynccontextmanager
 async def lifespan(app: FastAPI):
     """Application lifespan - initialize Copilot client on startup"""
-    global copilot_client, PPT_DIR
+    global copilot_client, session_pool, PPT_DIR
     
     logger.info("🚀 Starting PPT Agent...")
     logger.info(f"Work Directory: {WORK_DIR}")
     logger.info(f"Skills Directory: {SKILLS_DIR}")
     logger.info(f"PPT Directory: {PPT_DIR}")
     
+    # Run new tasks eagerly up to their first suspension instead of
+    # scheduling them through the loop (Python 3.12+)
+    if sys.version_info >= (3, 12):
+        asyncio.get_running_loop().set_task_factory(asyncio.eager_task_factory)
+    
     try:
         # Check and create ppt folder if not exists
-        if not os.path.exists(PPT_DIR):
-            os.makedirs(PPT_DIR)
+        if not PPT_DIR.exists():
+            PPT_DIR.mkdir(parents=True)
             logger.info(f"✅ Created ppt folder at: {PPT_DIR}")
         else:
             logger.info(f"✅ PPT folder exists at: {PPT_DIR}")
@@ -72,6 +197,10 @@ async def lifespan(app: FastAPI):
         copilot_client = CopilotClient()
         await copilot_client.start()
         
+        # Warm Copilot sessions ahead of the first request
+        session_pool = SessionPool(copilot_client, SESSION_CONFIG, SESSION_POOL_SIZE)
+        session_pool.start()
+        
         logger.info("✅ PPT Agent initialized successfully")
         
     except Exception as e:
@@ -82,6 +211,8 @@ async def lifespan(app: FastAPI):
     
     # Cleanup
     logger.info("🛑 Shutting down PPT Agent...")
+    if session_pool:
+        await session_pool.close()
     if copilot_client:
         await copilot_client.stop()
 
@@ -91,7 +222,8 @@ app = FastAPI(
     title="PPT Agent",
     description="GitHub Copilot SDK-based PPT Generation Agent",
     version="1.0.0",
-    lifespan=lifespan
+    lifespan=lifespan,
+    default_response_class=ORJSONResponse  # orjson serialization for every JSON endpoint
 )
 
 
@@ -130,14 +262,52 @@ class A2ARequest(BaseModel):
     params: Optional[Dict[str, Any]] = None
 
 
+async def _run_copilot(prompt: str, *, on_chunk: Optional[Callable[[str], None]] = None, timeout: float = 600) -> str:
+    """Run a prompt in a fresh pooled Copilot session and return the full response text
+    
+    on_chunk, when given, is called with each streamed delta as it arrives.
+    """
+    session = await session_pool.acquire()
+    
+    logger.info(f"✓ Session acquired with ID: {session.session_id}")
+    
+    # Collect the response
+    response_chunks = []
+    delta_type = SessionEventType.ASSISTANT_MESSAGE_DELTA
+    append_delta = response_chunks.append
+    
+    if on_chunk is None:
+        def handle_event(event):
+            if event.type is delta_type:
+                append_delta(event.data.delta_content)
+    else:
+        def handle_event(event):
+            if event.type is delta_type:
+                delta = event.data.delta_content
+                append_delta(delta)
+                on_chunk(delta)
+    
+    # The SDK only exposes callback subscription (no delta iterator), so
+    # detach the handler once the response is complete
+    unsubscribe = session.on(handle_event)
+    try:
+        await session.send_and_wait({"prompt": prompt}, timeout=timeout)
+    finally:
+        unsubscribe()
+        await session_pool.release(session)
+    
+    return ''.join(response_chunks)
+
+
 async def process_a2a_message_streaming(message_text: str, jsonrpc: str, request_id: str, task_id: str, context_id: str):
     """Process an A2A message and yield SSE events as the response is generated"""
-    import json
     global copilot_client
     
-    message_id_working = str(uuid.uuid4())
-    message_id_complete = str(uuid.uuid4())
-    artifact_id = str(uuid.uuid4())
+    message_id_working = _uuid()
+    message_id_complete = _uuid()
+    artifact_id = _uuid()
+    # Heartbeats are transient progress updates, so they all share one id
+    message_id_heartbeat = _uuid()
     
     # Send initial working status immediately
     status_event = {
@@ -158,7 +328,7 @@ async def process_a2a_message_streaming(message_text: str, jsonrpc: str, request
             "kind": "status-update"
         }
     }
-    yield f"data: {json.dumps(status_event)}\n\n"
+    yield _sse_event(status_event)
     
     if copilot_client is None:
         error_event = {
@@ -171,7 +341,7 @@ async def process_a2a_message_streaming(message_text: str, jsonrpc: str, request
                 "status": {
                     "state": "failed",
                     "message": {
-                        "messageId": str(uuid.uuid4()),
+                        "messageId": _uuid(),
                         "role": "agent",
                         "parts": [{"kind": "text", "text": "Agent not initialized"}]
                     }
@@ -179,66 +349,69 @@ async def process_a2a_message_streaming(message_text: str, jsonrpc: str, request
                 "kind": "status-update"
             }
         }
-        yield f"data: {json.dumps(error_event)}\n\n"
+        yield _sse_event(error_event)
         return
     
     try:
-        # Create a new session for this task
-        session = await copilot_client.create_session({
-            "model": "claude-sonnet-4.5",
-            "streaming": True,
-            "skill_directories": [SKILLS_DIR]
-        })
-        
-        logger.info(f"✓ A2A Session created with ID: {session.session_id}")
-        
-        # Collect the response
-        response_chunks = []
+        # Count chunks and wake the heartbeat loop as they arrive
         chunk_count = 0
+        progress = asyncio.Event()
+        signal_progress = progress.set
         
-        def handle_event(event):
+        def on_chunk(delta: str):
             nonlocal chunk_count
-            if event.type == SessionEventType.ASSISTANT_MESSAGE_DELTA:
-                response_chunks.append(event.data.delta_content)
-                chunk_count += 1
-        
-        session.on(handle_event)
+            chunk_count += 1
+            signal_progress()
         
         # Start the task (non-blocking)
-        task = asyncio.create_task(session.send_and_wait({"prompt": message_text}, timeout=600))
+        loop = asyncio.get_running_loop()
+        started = loop.time()
+        task = asyncio.create_task(_run_copilot(message_text, on_chunk=on_chunk))
         
-        # Send periodic heartbeat events while waiting
-        heartbeat_count = 0
+        # Build the heartbeat envelope once per request; only the text changes
+        # between beats (frames are encoded before the next mutation)
+        heartbeat_event = {
+            "jsonrpc": jsonrpc,
+            "id": request_id,
+            "result": {
+                "contextId": context_id,
+                "taskId": task_id,
+                "final": False,
+                "status": {
+                    "state": "working",
+                    "message": {
+                        "messageId": message_id_heartbeat,
+                        "role": "agent",
+                        "parts": [{"kind": "text", "text": ""}]
+                    }
+                },
+                "kind": "status-update"
+            }
+        }
+        heartbeat_part = heartbeat_event["result"]["status"]["message"]["parts"][0]
+        
+        # Send heartbeat events when new chunks arrive, or at least every
+        # HEARTBEAT_MAX_INTERVAL seconds to keep the connection alive
         while not task.done():
-            await asyncio.sleep(5)  # Check every 5 seconds
-            heartbeat_count += 1
+            progress_waiter = asyncio.create_task(progress.wait())
+            done, _ = await asyncio.wait(
+                {task, progress_waiter},
+                timeout=HEARTBEAT_MAX_INTERVAL,
+                return_when=asyncio.FIRST_COMPLETED
+            )
+            progress_waiter.cancel()
+            if task in done:
+                break
+            progress.clear()
             
-            # Send a working status update to keep connection alive
-            heartbeat_event = {
-                "jsonrpc": jsonrpc,
-                "id": request_id,
-                "result": {
-                    "contextId": context_id,
-                    "taskId": task_id,
-                    "final": False,
-                    "status": {
-                        "state": "working",
-                        "message": {
-                            "messageId": str(uuid.uuid4()),
-                            "role": "agent",
-                            "parts": [{"kind": "text", "text": f"Still generating PPT... ({heartbeat_count * 5}s elapsed, {len(response_chunks)} chunks received)"}]
-                        }
-                    },
-                    "kind": "status-update"
-                }
-            }
-            yield f"data: {json.dumps(heartbeat_event)}\n\n"
+            heartbeat_part["text"] = f"Still generating PPT... ({int(loop.time() - started)}s elapsed, {chunk_count} chunks received)"
+            yield _sse_event(heartbeat_event)
+            
+            # Throttle progress reports; completion still preempts the pause
+            await asyncio.wait({task}, timeout=HEARTBEAT_MIN_INTERVAL)
         
         # Wait for the task to complete and get any exception
-        await task
-        
-        # Combine response
-        response_text = ''.join(response_chunks)
+        response_text = await task
         if not response_text:
             response_text = "PPT generation completed successfully."
         
@@ -261,7 +434,7 @@ async def process_a2a_message_streaming(message_text: str, jsonrpc: str, request
                 "kind": "artifact-update"
             }
         }
-        yield f"data: {json.dumps(artifact_event)}\n\n"
+        yield _sse_event(artifact_event)
         
         # Send completion status
         complete_event = {
@@ -282,7 +455,7 @@ async def process_a2a_message_streaming(message_text: str, jsonrpc: str, request
                 "kind": "status-update"
             }
         }
-        yield f"data: {json.dumps(complete_event)}\n\n"
+        yield _sse_event(complete_event)
         
     except Exception as e:
         logger.error(f"❌ Error processing A2A message: {e}", exc_info=True)
@@ -296,7 +469,7 @@ async def process_a2a_message_streaming(message_text: str, jsonrpc: str, request
                 "status": {
                     "state": "failed",
                     "message": {
-                        "messageId": str(uuid.uuid4()),
+                        "messageId": _uuid(),
                         "role": "agent",
                         "parts": [{"kind": "text", "text": f"Error: {str(e)}"}]
                     }
@@ -304,7 +477,7 @@ async def process_a2a_message_streaming(message_text: str, jsonrpc: str, request
                 "kind": "status-update"
             }
         }
-        yield f"data: {json.dumps(error_event)}\n\n"
+        yield _sse_event(error_event)
 
 
 async def process_a2a_message(message_text: str) -> str:
@@ -315,29 +488,8 @@ async def process_a2a_message(message_text: str) -> str:
         return "Agent not initialized"
     
     try:
-        # Create a new session for this task
-        session = await copilot_client.create_session({
-            "model": "claude-sonnet-4.5",
-            "streaming": True,
-            "skill_directories": [SKILLS_DIR]
-        })
-        
-        logger.info(f"✓ A2A Session created with ID: {session.session_id}")
-        
-        # Collect the response
-        response_chunks = []
-        
-        def handle_event(event):
-            if event.type == SessionEventType.ASSISTANT_MESSAGE_DELTA:
-                response_chunks.append(event.data.delta_content)
-        
-        session.on(handle_event)
-        
         # Execute task with timeout
-        await session.send_and_wait({"prompt": message_text}, timeout=600)
-        
-        # Combine response
-        response_text = ''.join(response_chunks)
+        response_text = await _run_copilot(message_text)
         
         return response_text if response_text else "PPT generation completed successfully."
         
@@ -348,11 +500,10 @@ async def process_a2a_message(message_text: str) -> str:
 
 async def generate_sse_response(jsonrpc: str, request_id: str, task_id: str, context_id: str, result_text: str):
     """Generate Server-Sent Events response for A2A protocol"""
-    import json
     
-    message_id_working = str(uuid.uuid4())
-    message_id_complete = str(uuid.uuid4())
-    artifact_id = str(uuid.uuid4())
+    message_id_working = _uuid()
+    message_id_complete = _uuid()
+    artifact_id = _uuid()
     
     # Send task status update - working
     status_event = {
@@ -373,7 +524,7 @@ async def generate_sse_response(jsonrpc: str, request_id: str, task_id: str, con
             "kind": "status-update"
         }
     }
-    yield f"data: {json.dumps(status_event)}\n\n"
+    yield _sse_event(status_event)
     
     # Send the artifact with result
     artifact_event = {
@@ -394,7 +545,7 @@ async def generate_sse_response(jsonrpc: str, request_id: str, task_id: str, con
             "kind": "artifact-update"
         }
     }
-    yield f"data: {json.dumps(artifact_event)}\n\n"
+    yield _sse_event(artifact_event)
     
     # Send completion status
     complete_event = {
@@ -415,7 +566,7 @@ async def generate_sse_response(jsonrpc: str, request_id: str, task_id: str, con
             "kind": "status-update"
         }
     }
-    yield f"data: {json.dumps(complete_event)}\n\n"
+    yield _sse_event(complete_event)
 
 
 @app.post("/")
@@ -432,7 +583,7 @@ async def a2a_jsonrpc_endpoint(request: Request):
     Returns Server-Sent Events (SSE) stream as required by A2A protocol
     """
     try:
-        body = await request.json()
+        body = orjson.loads(await request.body())
         logger.info(f"📥 A2A Request: {body.get('method', 'unknown')}")
         
         jsonrpc = body.get("jsonrpc", "2.0")
@@ -458,27 +609,20 @@ async def a2a_jsonrpc_endpoint(request: Request):
             logger.info(f"📝 Processing PPT request: {message_text[:100]}...")
             
             # Generate task/message ID and context ID
-            task_id = params.get("id") or str(uuid.uuid4())
-            context_id = params.get("contextId") or str(uuid.uuid4())
+            task_id = params.get("id") or _uuid()
+            context_id = params.get("contextId") or _uuid()
             
             # Return SSE streaming response with heartbeat support
-            return StreamingResponse(
-                process_a2a_message_streaming(message_text, jsonrpc, request_id, task_id, context_id),
-                media_type="text/event-stream",
-                headers={
-                    "Cache-Control": "no-cache",
-                    "Connection": "keep-alive",
-                    "X-Accel-Buffering": "no"
-                }
+            return _event_stream(
+                process_a2a_message_streaming(message_text, jsonrpc, request_id, task_id, context_id)
             )
         
         elif method == "tasks/get":
             # Return task status as SSE
             task_id = params.get("id", "unknown")
-            context_id = params.get("contextId") or str(uuid.uuid4())
+            context_id = params.get("contextId") or _uuid()
             
             async def status_sse():
-                import json
                 event = {
                     "jsonrpc": jsonrpc,
                     "id": request_id,
@@ -492,17 +636,13 @@ async def a2a_jsonrpc_endpoint(request: Request):
                         "kind": "status-update"
                     }
                 }
-                yield f"data: {json.dumps(event)}\n\n"
+                yield _sse_event(event)
             
-            return StreamingResponse(
-                status_sse(),
-                media_type="text/event-stream"
-            )
+            return _event_stream(status_sse())
         
         else:
             # Unknown method - return error as SSE
             async def error_sse():
-                import json
                 event = {
                     "jsonrpc": jsonrpc,
                     "id": request_id,
@@ -511,18 +651,14 @@ async def a2a_jsonrpc_endpoint(request: Request):
                         "message": f"Method not found: {method}"
                     }
                 }
-                yield f"data: {json.dumps(event)}\n\n"
+                yield _sse_event(event)
             
-            return StreamingResponse(
-                error_sse(),
-                media_type="text/event-stream"
-            )
+            return _event_stream(error_sse())
             
     except Exception as e:
         logger.error(f"❌ A2A Error: {e}", exc_info=True)
         
         async def exception_sse():
-            import json
             event = {
                 "jsonrpc": "2.0",
                 "id": None,
@@ -531,12 +667,9 @@ async def a2a_jsonrpc_endpoint(request: Request):
                     "message": str(e)
                 }
             }
-            yield f"data: {json.dumps(event)}\n\n"
+            yield _sse_event(event)
         
-        return StreamingResponse(
-            exception_sse(),
-            media_type="text/event-stream"
-        )
+        return _event_stream(exception_sse())
 
 
 @app.get("/")
@@ -558,6 +691,29 @@ async def health():
     return {"status": "healthy"}
 
 
+def _scan_ppts() -> List[tuple]:
+    """Return (filename, stat_result) for every presentation file in a single directory pass"""
+    with os.scandir(PPT_DIR) as entries:
+        return [
+            (entry.name, entry.stat())
+            for entry in entries
+            if entry.is_file() and os.path.splitext(entry.name)[1] in PPT_EXTENSIONS
+        ]
+
+
+def _latest_ppt() -> Optional[str]:
+    """Return the name of the most recently modified presentation file, tracked in one directory pass"""
+    latest = None
+    latest_mtime = -1.0
+    with os.scandir(PPT_DIR) as entries:
+        for entry in entries:
+            if entry.is_file() and os.path.splitext(entry.name)[1] in PPT_EXTENSIONS:
+                mtime = entry.stat().st_mtime
+                if mtime > latest_mtime:
+                    latest, latest_mtime = entry.name, mtime
+    return latest
+
+
 @app.get("/ppt/{filename}")
 async def download_ppt(filename: str):
     """
@@ -565,27 +721,24 @@ async def download_ppt(filename: str):
     
     Example: GET /ppt/presentation-2026-01-30.pptx
     """
-    file_path = Path(PPT_DIR) / filename
+    file_path = PPT_DIR / filename
     
-    if not file_path.exists():
+    try:
+        st = file_path.stat()
+    except FileNotFoundError:
         raise HTTPException(status_code=404, detail=f"PPT file '{filename}' not found")
     
     # Allow common presentation formats
-    allowed_extensions = [".pptx", ".ppt", ".pdf", ".md"]
-    if file_path.suffix.lower() not in allowed_extensions:
+    suffix = file_path.suffix.lower()
+    if suffix not in PPT_EXTENSIONS:
         raise HTTPException(status_code=400, detail="Only presentation files are allowed")
     
-    media_types = {
-        ".pptx": "application/vnd.openxmlformats-officedocument.presentationml.presentation",
-        ".ppt": "application/vnd.ms-powerpoint",
-        ".pdf": "application/pdf",
-        ".md": "text/markdown"
-    }
-    
+    # Reusing the stat result skips Starlette's own stat before sendfile
     return FileResponse(
         path=str(file_path),
         filename=filename,
-        media_type=media_types.get(file_path.suffix.lower(), "application/octet-stream")
+        media_type=PPT_MEDIA_TYPES.get(suffix, "application/octet-stream"),
+        stat_result=st
     )
 
 
@@ -598,24 +751,30 @@ async def list_ppts():
     """
     try:
         # Search for various presentation formats
-        ppt_files = []
-        for ext in ["*.pptx", "*.ppt", "*.pdf", "*.md"]:
-            ppt_files.extend(list(Path(PPT_DIR).glob(ext)))
-        
-        ppts = []
-        for ppt_file in sorted(ppt_files, key=lambda p: p.stat().st_mtime, reverse=True):
-            ppts.append({
-                "filename": ppt_file.name,
-                "download_url": f"/ppt/{ppt_file.name}",
-                "size": ppt_file.stat().st_size,
-                "modified": datetime.fromtimestamp(ppt_file.stat().st_mtime).isoformat()
-            })
-        return {"ppts": ppts, "total": len(ppts)}
+        ppt_files = sorted(_scan_ppts(), key=lambda item: item[1].st_mtime, reverse=True)
     except Exception as e:
         raise HTTPException(status_code=500, detail=f"Error listing PPTs: {str(e)}")
+    
+    # Stream one encoded entry at a time instead of materializing the whole list
+    async def ppts_json():
+        yield b'{"ppts":['
+        separator = b""
+        for name, stat in ppt_files:
+            yield separator + orjson.dumps({
+                "filename": name,
+                "download_url": f"/ppt/{name}",
+                "size": stat.st_size,
+                "modified": datetime.fromtimestamp(stat.st_mtime).isoformat()
+            })
+            separator = b","
+        yield b'],"total":' + str(len(ppt_files)).encode() + b"}"
+    
+    return StreamingResponse(ppts_json(), media_type="application/json")
 
 
-@app.post("/task", response_model=TaskResponse)
+# The response is built server-side from trusted values and returned directly as
+# ORJSONResponse; TaskResponse only documents it in the OpenAPI schema
+@app.post("/task", response_model=None, responses={200: {"model": TaskResponse}})
 async def execute_task(request: TaskRequest):
     """
     Execute a PPT generation task
@@ -631,24 +790,6 @@ async def execute_task(request: TaskRequest):
     logger.info(f"📝 Task from {request.user_id}: {request.task}")
     
     try:
-        # Create a new session for this task
-        session = await copilot_client.create_session({
-            "model": "claude-sonnet-4.5",
-            "streaming": True,
-            "skill_directories": [SKILLS_DIR]
-        })
-        
-        logger.info(f"✓ Session created with ID: {session.session_id}")
-        
-        # Collect the response
-        response_chunks = []
-        
-        def handle_event(event):
-            if event.type == SessionEventType.ASSISTANT_MESSAGE_DELTA:
-                response_chunks.append(event.data.delta_content)
-        
-        session.on(handle_event)
-        
         # Enhanced prompt to leverage the PPT skill
         enhanced_prompt = f"""
 {request.task}
@@ -662,55 +803,40 @@ Please follow the PPT Skill guidelines:
         """
         
         # Execute task with timeout (10 minutes for complex PPT generation)
-        await session.send_and_wait({"prompt": enhanced_prompt}, timeout=600)
-        
-        # Combine response
-        response_text = ''.join(response_chunks)
+        response_text = await _run_copilot(enhanced_prompt)
         
         # Find the generated PPT file
         ppt_path = None
         download_url = None
         try:
             # Look for the most recently created PPT file
-            ppt_files = []
-            for ext in ["*.pptx", "*.ppt", "*.pdf", "*.md"]:
-                ppt_files.extend(list(Path(PPT_DIR).glob(ext)))
+            latest_ppt = _latest_ppt()
             
-            if ppt_files:
-                # Get the most recent file
-                latest_ppt = max(ppt_files, key=lambda p: p.stat().st_mtime)
-                ppt_path = str(latest_ppt.absolute())
+            if latest_ppt:
+                ppt_path = str(PPT_DIR / latest_ppt)
                 # Create a relative download path
-                download_url = f"/ppt/{latest_ppt.name}"
+                download_url = f"/ppt/{latest_ppt}"
                 logger.info(f"📄 Generated PPT: {ppt_path}")
         except Exception as e:
             logger.warning(f"Could not determine PPT path: {e}")
         
         logger.info(f"✅ Task completed for {request.user_id}")
         
-        return TaskResponse(
-            result=response_text if response_text else "PPT generated successfully. Check the ppt folder.",
-            agent="ppt_agent",
-            ppt_path=ppt_path,
-            download_url=download_url
-        )
+        return ORJSONResponse({
+            "result": response_text if response_text else "PPT generated successfully. Check the ppt folder.",
+            "agent": "ppt_agent",
+            "ppt_path": ppt_path,
+            "download_url": download_url
+        })
         
     except Exception as e:
         logger.error(f"❌ Error executing task: {e}", exc_info=True)
         raise HTTPException(status_code=500, detail=f"Error executing task: {str(e)}")
 
 
-@app.get("/.well-known/agent-card.json")
-async def agent_card():
-    """
-    A2A Protocol: Agent Card endpoint
-    
-    This endpoint exposes the agent's capabilities for discovery by other agents
-    and the orchestrator.
-    
-    Follows A2A Protocol specification: https://a2a-protocol.org/latest/
-    """
-    return JSONResponse({
+def _build_agent_card() -> Dict[str, Any]:
+    """Build the A2A Agent Card served at /.well-known/agent-card.json"""
+    return {
         "name": "ppt_agent",
         "description": "Specialized PPT generation agent for creating professional presentations with code examples",
         "version": "1.0.0",
@@ -774,13 +900,31 @@ async def agent_card():
             "organization": "Kinfey Lo",
             "url": "https://github.com/kinfey"
         }
-    })
+    }
+
+
+# The card never changes for the life of the process, so serialize it once
+AGENT_CARD_BYTES = orjson.dumps(_build_agent_card())
+
+
+@app.get("/.well-known/agent-card.json")
+async def agent_card():
+    """
+    A2A Protocol: Agent Card endpoint
+    
+    This endpoint exposes the agent's capabilities for discovery by other agents
+    and the orchestrator.
+    
+    Follows A2A Protocol specification: https://a2a-protocol.org/latest/
+    """
+    return Response(content=AGENT_CARD_BYTES, media_type="application/json")
 
 
 if __name__ == "__main__":
     import uvicorn
     
     logger.info(f"📊 Starting PPT Agent on port {AGENT_PORT}")
+    # The default "auto" loop/http settings use uvloop and httptools when installed
     uvicorn.run(
         app,
         host="0.0.0.0",
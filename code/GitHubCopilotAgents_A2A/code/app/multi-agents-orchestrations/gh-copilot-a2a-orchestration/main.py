@@ -18,24 +18,44 @@ For more information about the A2A protocol specification, visit: https://a2a-pr
 Configuration:
 - Set A2A_AGENT_HOST in .env file with comma-separated URLs
   (e.g., A2A_AGENT_HOST=https://ppt-agent.example.com,https://blog-agent.example.com)
-- Ensure each agent exposes its AgentCard at /.well-known/agent.json
+- Ensure each agent exposes its AgentCard at /.well-known/agent-card.json
 
 Usage:
-    python main.py
+    python main.py [--interactive] [--no-cache] [--embedding]
+    
+    --no-cache skips the on-disk agent card cache and always fetches fresh cards.
+    --embedding routes by semantic similarity instead of keywords (requires sentence-transformers).
 """
 
 import asyncio
 import os
 import logging
 import re
+from array import array
+from collections import OrderedDict
 from dataclasses import dataclass, field
-from typing import Optional, List, Dict, Any
+from typing import Optional, List, Dict, Any, Set
 
 import httpx
 from dotenv import load_dotenv
 from a2a.client import A2ACardResolver
 from agent_framework.a2a import A2AAgent
 
+try:
+    import ahocorasick  # pyahocorasick: single-pass multi-keyword matching
+except ImportError:
+    ahocorasick = None
+
+try:
+    import diskcache  # on-disk TTL cache for discovered agent cards
+except ImportError:
+    diskcache = None
+
+try:
+    import h2  # enables HTTP/2 in httpx (httpx[http2])
+except ImportError:
+    h2 = None
+
 # Load environment variables from .env file
 load_dotenv()
 
@@ -46,6 +66,67 @@ logging.basicConfig(
 )
 logger = logging.getLogger(__name__)
 
+# Common/generic tags and name words that don't help differentiate agents
+_GENERIC_TAGS = frozenset({'technical', 'tutorial', 'guide', 'code', 'examples'})
+_NAME_STOPWORDS = frozenset({'agent', 'the', 'a'})
+
+# Maximum number of agent cards fetched at the same time during discovery
+DISCOVERY_CONCURRENCY = 16
+
+# Where the agents in this repo serve their card; pinned so older a2a-sdk defaults don't apply
+AGENT_CARD_PATH = "/.well-known/agent-card.json"
+
+# Agent cards rarely change, so discovery results are reused across runs
+CARD_CACHE_DIR = ".a2a_card_cache"
+CARD_CACHE_TTL = 3600  # seconds
+PRECONNECT_TIMEOUT = 5.0  # seconds; warming a connection for a cached card is best effort
+
+# Sentence embedding model for the embedding routing strategy and semantic routing cache
+EMBEDDING_MODEL = 'all-MiniLM-L6-v2'
+EMBEDDING_MATCH_THRESHOLD = 0.3  # minimum cosine similarity for an embedding match
+
+
+def _create_http_client() -> httpx.AsyncClient:
+    """
+    Create the HTTP client shared by discovery and task dispatch.
+    
+    The timeout allows long-running tasks (10 minutes). Connections are pooled
+    and kept alive for the concurrent fan-out, multiplexed over HTTP/2 when h2
+    is installed, and a failed connection attempt is retried once. Limits and
+    HTTP/2 are set on the transport, since httpx ignores the client-level ones
+    when a transport is given.
+    """
+    return httpx.AsyncClient(
+        timeout=httpx.Timeout(600.0, connect=30.0),
+        transport=httpx.AsyncHTTPTransport(
+            http2=h2 is not None,
+            limits=httpx.Limits(max_connections=64, max_keepalive_connections=32, keepalive_expiry=300),
+            retries=1,
+        ),
+    )
+
+
+def _compile_chunked(words: List[str], size: int = 25) -> List[tuple]:
+    """
+    Compile words into alternation regexes of at most `size` words each.
+    
+    Returns (pattern, words) pairs. Words are expected to be lowercased already,
+    so no IGNORECASE flag is needed.
+    """
+    return [
+        (re.compile('|'.join(map(re.escape, chunk))), chunk)
+        for chunk in (words[i:i + size] for i in range(0, len(words), size))
+    ]
+
+
+def _matched_words(chunks: List[tuple], task_lower: str):
+    """Yield each word that occurs in task_lower, skipping whole chunks whose regex finds nothing."""
+    for pattern, words in chunks:
+        if pattern.search(task_lower):
+            for word in words:
+                if word in task_lower:
+                    yield word
+
 
 @dataclass
 class AgentInfo:
@@ -59,61 +140,34 @@ class AgentInfo:
     examples: List[str] = field(default_factory=list)
     primary_keywords: List[str] = field(default_factory=list)  # Keywords from agent card for routing
     
-    def matches_task(self, task: str, all_agents_keywords: Dict[str, List[str]] = None) -> float:
-        """
-        Calculate a relevance score for the task based on agent capabilities.
-        
-        Args:
-            task: The task description to match
-            all_agents_keywords: Dict of agent_name -> primary_keywords for negative scoring
-            
-        Returns:
-            A relevance score (0.0 to 1.0)
-        """
-        task_lower = task.lower()
-        score = 0.0
-        
-        # Check primary keywords from agent card (highest priority)
-        for keyword in self.primary_keywords:
-            if keyword.lower() in task_lower:
-                score += 0.5  # Strong match for primary keywords
-                logger.debug(f"Primary keyword match: '{keyword}' for agent '{self.name}'")
-        
-        # Negative scoring: penalize if task contains keywords for OTHER agents
-        if all_agents_keywords:
-            for other_agent, other_keywords in all_agents_keywords.items():
-                if other_agent != self.name:
-                    for keyword in other_keywords:
-                        if keyword.lower() in task_lower:
-                            score -= 0.3  # Penalize for keywords meant for other agents
-        
-        # Check tags (medium weight)
-        for tag in self.tags:
-            tag_lower = tag.lower()
-            # Skip common/generic tags that don't help differentiation
-            if tag_lower in ['technical', 'tutorial', 'guide', 'code', 'examples']:
-                continue
-            if tag_lower in task_lower:
-                score += 0.2
-        
-        # Check skill IDs for exact matches (most specific)
-        for skill in self.skills:
-            skill_id = skill.get('id', '').lower()
-            if skill_id:
-                # Check if skill_id keywords appear in task
-                skill_keywords = skill_id.replace('_', ' ').split()
-                for kw in skill_keywords:
-                    if len(kw) > 3 and kw in task_lower:
-                        score += 0.15
-        
-        # Check agent name keywords
-        agent_name_lower = self.name.lower()
-        name_parts = re.findall(r'\b\w+\b', agent_name_lower)
-        for part in name_parts:
-            if part not in ['agent', 'the', 'a'] and part in task_lower:
-                score += 0.25
-        
-        return max(0.0, min(score, 1.0))  # Clamp between 0.0 and 1.0
+    def __post_init__(self):
+        # Lowercase the routing tokens once; the orchestrator's routing index is built from them
+        self._primary_keywords_lc = [k.lower() for k in self.primary_keywords]
+        self._tags_lc = [t for t in (tag.lower() for tag in self.tags) if t not in _GENERIC_TAGS]
+        self._skill_tokens_lc = [
+            kw
+            for skill in self.skills
+            for kw in (skill.get('id') or '').lower().replace('_', ' ').split()
+            if len(kw) > 3
+        ]
+        self._name_tokens_lc = [
+            part for part in re.findall(r'\b\w+\b', self.name.lower()) if part not in _NAME_STOPWORDS
+        ]
+
+
+def _extract_primary_keywords(agent_card) -> List[str]:
+    """
+    Read the custom primaryKeywords extension from an agent card.
+    
+    Different card parsers expose the field differently, so try the attribute
+    names first and fall back to the Pydantic extra fields (or __dict__).
+    """
+    for attr in ('primary_keywords', 'primaryKeywords'):
+        value = getattr(agent_card, attr, None)
+        if value:
+            return list(value)
+    extra = getattr(agent_card, 'model_extra', None) or getattr(agent_card, '__dict__', None) or {}
+    return list(extra.get('primaryKeywords') or ())
 
 
 class MultiAgentOrchestrator:
@@ -121,10 +175,79 @@ class MultiAgentOrchestrator:
     Orchestrator for managing multiple A2A agents with intelligent task routing.
     """
     
-    def __init__(self, http_client: httpx.AsyncClient):
+    def __init__(
+        self,
+        http_client: httpx.AsyncClient,
+        use_card_cache: bool = True,
+        cache_enabled: bool = True,
+        similarity_threshold: Optional[float] = None,
+        cache_size: int = 512,
+        strategy: str = 'keyword',
+    ):
+        """
+        Args:
+            http_client: Shared HTTP client for discovery and task calls
+            use_card_cache: Reuse agent cards cached on disk (requires diskcache)
+            cache_enabled: Remember routing decisions for previously seen tasks
+            similarity_threshold: Cosine similarity (e.g. 0.85) at which a cached decision
+                is reused for a paraphrased task; requires sentence-transformers. None disables it.
+            cache_size: Maximum number of routing decisions kept per cache
+            strategy: 'keyword' scores agents by keyword matches; 'embedding' picks the agent
+                whose capabilities are most similar to the task; requires sentence-transformers.
+        """
+        if strategy not in ('keyword', 'embedding'):
+            raise ValueError(f"Unknown routing strategy: {strategy!r}")
+        
         self.http_client = http_client
         self.agents: Dict[str, AgentInfo] = {}
         self.default_agent: Optional[str] = None
+        self._automaton = None  # Aho-Corasick index of routing tokens, when pyahocorasick is installed
+        # Positional views of self.agents, frozen at discovery; routing works on positions
+        self._agent_names: List[str] = []
+        self._agent_infos: List[AgentInfo] = []
+        self._agent_handles: List[A2AAgent] = []
+        self._agent_index: Dict[str, int] = {}  # agent name -> position
+        # Flat routing token table: the scoring entries for a token live at [start, end)
+        # of the parallel owner/weight/primary arrays
+        self._token_spans: Dict[str, tuple[int, int]] = {}
+        self._entry_owners = array('i')
+        self._entry_weights = array('d')
+        self._entry_primary = array('b')
+        self._token_re: List[tuple] = []
+        self._min_token_len = 0
+        self.strategy = strategy
+        self._agent_matrix = None  # (agents x dims) capability embeddings for the embedding strategy
+        self._card_cache = (
+            diskcache.Cache(CARD_CACHE_DIR) if use_card_cache and diskcache is not None else None
+        )
+        self._preconnects: Set[asyncio.Task] = set()  # keeps background preconnects referenced
+        
+        # Routing caches hold only the chosen agent name, never agent responses
+        self.cache_enabled = cache_enabled
+        self.similarity_threshold = similarity_threshold
+        self.cache_size = cache_size
+        self._exact_cache: "OrderedDict[str, int]" = OrderedDict()  # task -> agent position
+        self._embedding_cache: "OrderedDict[str, tuple]" = OrderedDict()  # task -> (embedding, agent position)
+        self._embedder = None  # lazily loaded SentenceTransformer; False if unavailable
+    
+    async def _preconnect(self, agent_host: str) -> None:
+        """Open a pooled connection to a host ahead of its first task."""
+        try:
+            await self.http_client.head(agent_host, timeout=PRECONNECT_TIMEOUT)
+        except Exception as e:
+            # Best effort: also covers the client closing under a pending HEAD
+            logger.debug("Preconnect to %s failed: %s", agent_host, e)
+    
+    def _cached_card(self, agent_host: str):
+        """Return the agent card cached for a host, or None if absent, expired, or unreadable."""
+        if self._card_cache is None:
+            return None
+        try:
+            return self._card_cache.get(f"card:{agent_host}")
+        except Exception as e:
+            # e.g. a card pickled by an incompatible a2a-sdk version
+            logger.warning(f"Ignoring cached agent card for {agent_host}: {e}")
+            return None
     
     async def discover_agent(self, agent_host: str) -> Optional[AgentInfo]:
         """
@@ -140,11 +263,29 @@ class MultiAgentOrchestrator:
             agent_host = agent_host.strip()
             logger.info(f"🔍 Discovering agent at: {agent_host}")
             
-            # Initialize A2ACardResolver to fetch the agent card
-            resolver = A2ACardResolver(httpx_client=self.http_client, base_url=agent_host)
-            
-            # Get agent card from /.well-known/agent.json
-            agent_card = await resolver.get_agent_card()
+            agent_card = self._cached_card(agent_host)
+            if agent_card is None:
+                # Initialize A2ACardResolver to fetch the agent card; it is bound to one
+                # base URL, but only wraps the shared client, so it costs one small object
+                resolver = A2ACardResolver(
+                    httpx_client=self.http_client, base_url=agent_host, agent_card_path=AGENT_CARD_PATH
+                )
+                
+                # Get agent card from /.well-known/agent-card.json
+                agent_card = await resolver.get_agent_card()
+                if self._card_cache is not None:
+                    try:
+                        self._card_cache.set(f"card:{agent_host}", agent_card, expire=CARD_CACHE_TTL)
+                    except Exception as e:
+                        # e.g. a full or read-only cache directory; the card is simply not cached
+                        logger.warning(f"Could not cache agent card for {agent_host}: {e}")
+            else:
+                logger.info(f"   Using cached agent card for {agent_host}")
+                # No card fetch opened a connection, so warm one up in the background
+                # rather than on the first task, without delaying discovery
+                preconnect = asyncio.create_task(self._preconnect(agent_host))
+                self._preconnects.add(preconnect)
+                preconnect.add_done_callback(self._preconnects.discard)
             
             logger.info(f"✅ Found agent: {agent_card.name}")
             logger.info(f"   Description: {agent_card.description}")
@@ -160,47 +301,37 @@ class MultiAgentOrchestrator:
             
             # Extract skills, tags, and examples from agent card
             skills = []
-            tags = []
-            examples = []
+            tag_set: Set[str] = set()
+            examples: List[str] = []
             
-            if hasattr(agent_card, 'skills') and agent_card.skills:
-                for skill in agent_card.skills:
-                    skill_dict = {}
-                    if hasattr(skill, 'id'):
-                        skill_dict['id'] = skill.id
-                    if hasattr(skill, 'name'):
-                        skill_dict['name'] = skill.name
-                    if hasattr(skill, 'description'):
-                        skill_dict['description'] = skill.description
-                    if hasattr(skill, 'tags') and skill.tags:
-                        skill_dict['tags'] = list(skill.tags)
-                        tags.extend(skill.tags)
-                    if hasattr(skill, 'examples') and skill.examples:
-                        skill_dict['examples'] = list(skill.examples)
-                        examples.extend(skill.examples)
-                    skills.append(skill_dict)
+            for skill in getattr(agent_card, 'skills', None) or ():
+                skill_dict = {
+                    key: value
+                    for key, value in (
+                        ('id', getattr(skill, 'id', None)),
+                        ('name', getattr(skill, 'name', None)),
+                        ('description', getattr(skill, 'description', None)),
+                    )
+                    if value is not None
+                }
+                skill_tags = getattr(skill, 'tags', None)
+                if skill_tags:
+                    skill_dict['tags'] = list(skill_tags)
+                    tag_set.update(skill_tags)
+                skill_examples = getattr(skill, 'examples', None)
+                if skill_examples:
+                    skill_dict['examples'] = list(skill_examples)
+                    examples.extend(skill_examples)
+                skills.append(skill_dict)
             
             # Extract primary keywords from agent card (custom extension)
-            # Try multiple ways to access the field due to different parsing behaviors
-            primary_keywords = []
-            if hasattr(agent_card, 'primary_keywords') and agent_card.primary_keywords:
-                primary_keywords = list(agent_card.primary_keywords)
-            elif hasattr(agent_card, 'primaryKeywords') and agent_card.primaryKeywords:
-                primary_keywords = list(agent_card.primaryKeywords)
-            # Try accessing via model_extra for Pydantic models with extra fields
-            elif hasattr(agent_card, 'model_extra') and agent_card.model_extra:
-                if 'primaryKeywords' in agent_card.model_extra:
-                    primary_keywords = list(agent_card.model_extra['primaryKeywords'])
-            # Try via __dict__ or direct attribute lookup
-            elif hasattr(agent_card, '__dict__'):
-                if 'primaryKeywords' in agent_card.__dict__:
-                    primary_keywords = list(agent_card.__dict__['primaryKeywords'])
+            primary_keywords = _extract_primary_keywords(agent_card)
             
             # Log agent capabilities
             if skills:
                 logger.info(f"   Skills: {[s.get('name', s.get('id', 'unknown')) for s in skills]}")
-            if tags:
-                logger.info(f"   Tags: {list(set(tags))}")
+            if tag_set:
+                logger.info(f"   Tags: {list(tag_set)}")
             if primary_keywords:
                 logger.info(f"   Primary Keywords: {primary_keywords}")
             
@@ -210,7 +341,7 @@ class MultiAgentOrchestrator:
                 name=agent_card.name,
                 description=agent_card.description or "",
                 skills=skills,
-                tags=list(set(tags)),
+                tags=list(tag_set),
                 examples=examples,
                 primary_keywords=primary_keywords
             )
@@ -219,19 +350,27 @@ class MultiAgentOrchestrator:
             logger.error(f"❌ Failed to discover agent at {agent_host}: {e}")
             return None
     
-    async def discover_all_agents(self, agent_hosts: List[str]) -> int:
+    async def discover_all_agents(
+        self, agent_hosts: List[str], discovery_concurrency: int = DISCOVERY_CONCURRENCY
+    ) -> int:
         """
         Discover all agents from a list of hosts concurrently.
         
         Args:
             agent_hosts: List of agent host URLs
+            discovery_concurrency: Maximum number of discoveries in flight at once
             
         Returns:
             Number of successfully discovered agents
         """
-        # Discover agents concurrently
-        tasks = [self.discover_agent(host) for host in agent_hosts]
-        results = await asyncio.gather(*tasks, return_exceptions=True)
+        # Discover agents concurrently, bounded so large fleets don't exhaust the connection pool
+        semaphore = asyncio.Semaphore(discovery_concurrency)
+        
+        async def bounded_discover(host: str) -> Optional[AgentInfo]:
+            async with semaphore:
+                return await self.discover_agent(host)
+        
+        results = await asyncio.gather(*(bounded_discover(host) for host in agent_hosts), return_exceptions=True)
         
         for result in results:
             if isinstance(result, AgentInfo):
@@ -241,50 +380,233 @@ class MultiAgentOrchestrator:
             elif isinstance(result, Exception):
                 logger.error(f"Discovery error: {result}")
         
+        self._build_routing_index()
         return len(self.agents)
     
+    def _build_routing_index(self) -> None:
+        """
+        Precompute the structures select_agent scores against.
+        
+        Every routing token of every agent goes into one flat table of
+        (owner, weight, primary) entries, so all agents, including the negative
+        scoring for other agents' primary keywords, are scored from a single
+        set of matched tokens. The tokens are found with one Aho-Corasick pass
+        over the task when pyahocorasick is installed, and with the chunked
+        regex prefilter otherwise. Agents are addressed by their position in
+        the frozen name list, so scores can be aggregated in a flat vector.
+        """
+        self._agent_names = list(self.agents)
+        self._agent_infos = list(self.agents.values())
+        self._agent_handles = [info.agent for info in self._agent_infos]
+        self._agent_index = {name: i for i, name in enumerate(self._agent_names)}
+        
+        # Cached decisions were made against the previous agent set
+        self._exact_cache.clear()
+        self._embedding_cache.clear()
+        
+        self._agent_matrix = None
+        if self.strategy == 'embedding' and self.agents:
+            embedder = self._load_embedder()
+            if embedder is None:
+                logger.warning("Embedding routing unavailable; falling back to keyword routing")
+            else:
+                # One normalized vector per agent, so scoring a task is a single matrix-vector product
+                self._agent_matrix = embedder.encode(
+                    [
+                        " ".join([
+                            info.description,
+                            *info.primary_keywords,
+                            *info.tags,
+                            *(skill['description'] for skill in info.skills if skill.get('description')),
+                            *info.examples,
+                        ])
+                        for info in self._agent_infos
+                    ],
+                    normalize_embeddings=True,
+                )
+        
+        entries: Dict[str, List[tuple]] = {}
+        for i, info in enumerate(self._agent_infos):
+            for weight, category, tokens in (
+                (0.5, 'primary', info._primary_keywords_lc),
+                (0.2, 'tag', info._tags_lc),
+                (0.15, 'skill', info._skill_tokens_lc),
+                (0.25, 'name', info._name_tokens_lc),
+            ):
+                for token in tokens:
+                    entries.setdefault(token, []).append((i, weight, category))
+        
+        self._token_spans = {}
+        self._entry_owners = array('i')
+        self._entry_weights = array('d')
+        self._entry_primary = array('b')
+        for token, token_entries in entries.items():
+            start = len(self._entry_owners)
+            self._token_spans[token] = (start, start + len(token_entries))
+            for owner, weight, category in token_entries:
+                self._entry_owners.append(owner)
+                self._entry_weights.append(weight)
+                self._entry_primary.append(category == 'primary')
+        self._token_re = _compile_chunked(list(entries))
+        # A task shorter than every token cannot match any of them
+        self._min_token_len = min(map(len, entries), default=0)
+        
+        self._automaton = None
+        if ahocorasick is None or not entries:
+            return
+        
+        automaton = ahocorasick.Automaton()
+        for token in entries:
+            automaton.add_word(token, token)
+        automaton.make_automaton()
+        self._automaton = automaton
+    
+    def _score_tokens(self, tokens) -> array:
+        """Score every agent from the distinct routing tokens found in a task."""
+        count = len(self._agent_names)
+        scores = array('d', bytes(8 * count))
+        spans = self._token_spans
+        owners, weights, primary = self._entry_owners, self._entry_weights, self._entry_primary
+        
+        for token in tokens:
+            start, end = spans[token]
+            for k in range(start, end):
+                owner = owners[k]
+                scores[owner] += weights[k]
+                if primary[k]:
+                    # Penalize every other agent for a keyword meant for this one
+                    for other in range(count):
+                        if other != owner:
+                            scores[other] -= 0.3
+        
+        for i in range(count):
+            scores[i] = max(0.0, min(scores[i], 1.0))
+        return scores
+    
+    def _load_embedder(self):
+        """Return the shared SentenceTransformer, loading it on first use, or None if not installed."""
+        if self._embedder is None:
+            try:
+                from sentence_transformers import SentenceTransformer
+            except ImportError:
+                logger.warning("sentence-transformers is not installed; embedding features disabled")
+                self._embedder = False
+                return None
+            self._embedder = SentenceTransformer(EMBEDDING_MODEL)
+        return self._embedder if self._embedder is not False else None
+    
+    def _embed(self, text: str):
+        """Return a normalized sentence embedding for text, or None if semantic caching is off."""
+        if self.similarity_threshold is None:
+            return None
+        embedder = self._load_embedder()
+        return embedder.encode(text, normalize_embeddings=True) if embedder is not None else None
+    
+    def _remember_route(self, key: str, embedding, index: int) -> None:
+        """Store a routing decision in the bounded LRU caches."""
+        self._exact_cache[key] = index
+        if len(self._exact_cache) > self.cache_size:
+            self._exact_cache.popitem(last=False)
+        if embedding is not None:
+            self._embedding_cache[key] = (embedding, index)
+            if len(self._embedding_cache) > self.cache_size:
+                self._embedding_cache.popitem(last=False)
+    
     def select_agent(self, task: str) -> Optional[AgentInfo]:
         """
         Select the most appropriate agent for a task based on capabilities.
         
+        Repeated tasks are answered from the routing cache; with a similarity
+        threshold set, sufficiently similar tasks reuse a cached decision too.
+        
         Args:
             task: The task description
             
         Returns:
             The most suitable AgentInfo, or default agent if no strong match
         """
+        index = self._select_index(task)
+        return self._agent_infos[index] if index is not None else None
+    
+    def _select_index(self, task: str) -> Optional[int]:
+        """Return the position of the agent select_agent would choose, or None."""
         if not self.agents:
             return None
-        
-        # Build a dict of all agents' primary keywords for negative scoring
-        all_agents_keywords: Dict[str, List[str]] = {
-            name: info.primary_keywords for name, info in self.agents.items()
-        }
-        
+        if len(self._agent_names) != len(self.agents):
+            # Agents were added or removed outside discovery
+            self._build_routing_index()
+        if len(self.agents) == 1:
+            # Nothing to choose between
+            return 0
+        if not task or task.isspace():
+            # Every score would be 0, so skip scoring and caching
+            return self._fallback_index()
+        
+        # Lowercase once for every scorer; already-lowercase prompts skip the copy
+        task_lower = task if task.islower() else task.lower()
+        
+        if not self.cache_enabled:
+            return self._score_and_select(task_lower)
+        
+        key = task_lower.strip()
+        cached = self._exact_cache.get(key)
+        if cached is not None:
+            self._exact_cache.move_to_end(key)
+            logger.info("🎯 Routing cache hit: %s", self._agent_names[cached])
+            return cached
+        
+        embedding = self._embed(key)
+        if embedding is not None and self._embedding_cache:
+            similarity, cached = max(
+                (float(embedding @ cached_embedding), index)
+                for cached_embedding, index in self._embedding_cache.values()
+            )
+            if similarity >= self.similarity_threshold:
+                logger.info("🎯 Semantic routing cache hit (%.2f): %s", similarity, self._agent_names[cached])
+                self._remember_route(key, embedding, cached)
+                return cached
+        
+        index = self._score_and_select(task_lower, embedding)
+        if index is not None:
+            self._remember_route(key, embedding, index)
+        return index
+    
+    def _score_and_select(self, task_lower: str, embedding=None) -> Optional[int]:
+        """Score every agent against the lowercased task and return the best match or the default agent's position."""
         # Calculate relevance scores for all agents
-        scores: List[tuple[str, float]] = []
-        for name, agent_info in self.agents.items():
-            score = agent_info.matches_task(task, all_agents_keywords)
-            scores.append((name, score))
-            logger.debug(f"Agent '{name}' score for task: {score:.2f}")
-        
-        # Sort by score descending
-        scores.sort(key=lambda x: x[1], reverse=True)
+        threshold = 0.1  # Minimum threshold for a keyword match
+        if self._agent_matrix is not None:
+            if embedding is None:
+                embedding = self._embedder.encode(task_lower.strip(), normalize_embeddings=True)
+            # Cosine similarity between the task and every agent's capabilities
+            scores = self._agent_matrix @ embedding
+            threshold = EMBEDDING_MATCH_THRESHOLD
+        elif len(task_lower) < self._min_token_len:
+            return self._fallback_index()
+        elif self._automaton is not None:
+            # A token counts once however often it occurs, matching substring checks
+            scores = self._score_tokens(dict.fromkeys(token for _, token in self._automaton.iter(task_lower)))
+        else:
+            scores = self._score_tokens(_matched_words(self._token_re, task_lower))
         
-        # Log the scoring results
-        logger.info(f"🎯 Agent selection scores:")
-        for name, score in scores:
-            logger.info(f"   {name}: {score:.2f}")
+        # Log the scoring results, highest first; skip the sort when INFO is off
+        if logger.isEnabledFor(logging.INFO):
+            logger.info("🎯 Agent selection scores:")
+            for i in sorted(range(len(scores)), key=scores.__getitem__, reverse=True):
+                logger.info("   %s: %.2f", self._agent_names[i], scores[i])
         
         # Return the highest scoring agent if score is above threshold
-        best_agent, best_score = scores[0]
-        if best_score > 0.1:  # Minimum threshold for a match
-            return self.agents[best_agent]
+        best = max(range(len(scores)), key=scores.__getitem__)
+        if scores[best] > threshold:
+            return best
         
-        # Fall back to default agent
+        return self._fallback_index()
+    
+    def _fallback_index(self) -> Optional[int]:
+        """Return the default agent's position when nothing matches, or None."""
         if self.default_agent:
-            logger.info(f"📌 No strong match, using default agent: {self.default_agent}")
-            return self.agents[self.default_agent]
+            logger.info("📌 No strong match, using default agent: %s", self.default_agent)
+            return self._agent_index[self.default_agent]
         
         return None
     
@@ -301,31 +623,31 @@ class MultiAgentOrchestrator:
         """
         # Select agent
         if agent_name and agent_name in self.agents:
-            agent_info = self.agents[agent_name]
+            if len(self._agent_names) != len(self.agents):
+                self._build_routing_index()
+            index = self._agent_index[agent_name]
         else:
-            agent_info = self.select_agent(task)
+            index = self._select_index(task)
         
-        if not agent_info:
+        if index is None:
             raise ValueError("No suitable agent found for the task")
         
-        logger.info(f"📤 Sending task to agent '{agent_info.name}': {task[:100]}...")
+        name = self._agent_names[index]
+        logger.info(f"📤 Sending task to agent '{name}': {task[:100]}...")
         
         try:
-            response = await agent_info.agent.run(task)
+            response = await self._agent_handles[index].run(task)
             
             # Extract text from response messages
-            result_texts = []
-            for message in response.messages:
-                if hasattr(message, 'text') and message.text:
-                    result_texts.append(message.text)
-            
-            result = "\n".join(result_texts)
-            logger.info(f"📥 Received response from '{agent_info.name}' ({len(result)} chars)")
+            result = "\n".join(
+                message.text for message in response.messages if getattr(message, 'text', None)
+            )
+            logger.info(f"📥 Received response from '{name}' ({len(result)} chars)")
             
-            return result, agent_info.name
+            return result, name
             
         except Exception as e:
-            logger.error(f"❌ Error sending task to agent '{agent_info.name}': {e}")
+            logger.error(f"❌ Error sending task to agent '{name}': {e}")
             raise
     
     def list_agents(self) -> None:
@@ -346,7 +668,7 @@ class MultiAgentOrchestrator:
         print("\n" + "=" * 60)
 
 
-async def main():
+async def main(use_card_cache: bool = True, strategy: str = 'keyword'):
     """
     Main function demonstrating multi-agent orchestration with auto-routing.
     """
@@ -372,10 +694,10 @@ async def main():
     print()
     
     # Create HTTP client with extended timeout for long-running tasks (10 minutes)
-    async with httpx.AsyncClient(timeout=httpx.Timeout(600.0, connect=30.0)) as http_client:
+    async with _create_http_client() as http_client:
         
         # Initialize orchestrator
-        orchestrator = MultiAgentOrchestrator(http_client)
+        orchestrator = MultiAgentOrchestrator(http_client, use_card_cache=use_card_cache, strategy=strategy)
         
         # Step 1: Discover all agents
         print("-" * 60)
@@ -387,7 +709,7 @@ async def main():
         if discovered_count == 0:
             print("❌ Could not connect to any A2A agents. Please ensure:")
             print("   1. The agents are running at the specified URLs")
-            print("   2. Each agent exposes /.well-known/agent.json")
+            print(f"   2. Each agent exposes {AGENT_CARD_PATH}")
             return
         
         print(f"\n✅ Successfully discovered {discovered_count} agent(s)")
@@ -432,7 +754,13 @@ async def main():
             },
         ]
         
-        for i, task_info in enumerate(test_tasks, 1):
+        # The tasks are independent, so dispatch them to their agents concurrently
+        results = await asyncio.gather(
+            *(orchestrator.send_task(task_info["task"]) for task_info in test_tasks),
+            return_exceptions=True
+        )
+        
+        for i, (task_info, result) in enumerate(zip(test_tasks, results), 1):
             task = task_info["task"]
             description = task_info["description"]
             
@@ -441,21 +769,22 @@ async def main():
             print(f"   Request: {task[:80]}...")
             print(f"{'─' * 60}")
             
-            try:
-                response, used_agent = await orchestrator.send_task(task)
-                print(f"\n🤖 Handled by: {used_agent}")
-                print(f"📄 Response preview: {response[:500]}...")
-                if len(response) > 500:
-                    print(f"   ... ({len(response) - 500} more characters)")
-            except Exception as e:
-                print(f"❌ Error: {e}")
+            if isinstance(result, Exception):
+                print(f"❌ Error: {result}")
+                continue
+            
+            response, used_agent = result
+            print(f"\n🤖 Handled by: {used_agent}")
+            print(f"📄 Response preview: {response[:500]}...")
+            if len(response) > 500:
+                print(f"   ... ({len(response) - 500} more characters)")
         
         print("\n" + "=" * 60)
         print("✅ Multi-Agent Orchestration Demo completed!")
         print("=" * 60)
 
 
-async def interactive_mode():
+async def interactive_mode(use_card_cache: bool = True, strategy: str = 'keyword'):
     """
     Interactive mode for testing multi-agent orchestration.
     """
@@ -471,8 +800,8 @@ async def interactive_mode():
     print("🤖 Multi-Agent Orchestration - Interactive Mode")
     print("=" * 60)
     
-    async with httpx.AsyncClient(timeout=httpx.Timeout(600.0, connect=30.0)) as http_client:
-        orchestrator = MultiAgentOrchestrator(http_client)
+    async with _create_http_client() as http_client:
+        orchestrator = MultiAgentOrchestrator(http_client, use_card_cache=use_card_cache, strategy=strategy)
         
         print("🔍 Discovering agents...")
         discovered_count = await orchestrator.discover_all_agents(agent_hosts)
@@ -515,7 +844,10 @@ async def interactive_mode():
 if __name__ == "__main__":
     import sys
     
-    if len(sys.argv) > 1 and sys.argv[1] == "--interactive":
-        asyncio.run(interactive_mode())
+    use_card_cache = "--no-cache" not in sys.argv[1:]
+    strategy = 'embedding' if "--embedding" in sys.argv[1:] else 'keyword'
+    
+    if "--interactive" in sys.argv[1:]:
+        asyncio.run(interactive_mode(use_card_cache=use_card_cache, strategy=strategy))
     else:
-        asyncio.run(main())
+        asyncio.run(main(use_card_cache=use_card_cache, strategy=strategy))